@@ -11,6 +11,11 @@ import board
 
 #from INA219DataProvider import DataProvider # add this to user_config.py
 #from INA260DataProvider import DataProvider # add this to user_config.py
+#
+# A DataProvider must implement get_dim(), get_units(), get_fmt(), reset()
+# and get_data(). get_fmt() returns %-style fields, one per value and
+# without the timestamp (e.g. "%.3f,%.3f"); str.format fields ("{1:.3f}")
+# of older providers are still accepted and converted by the logger.
 
 #from ESP01Logger       import DataLogger    # add this to user_config.py
 #from ESP32Logger       import DataLogger    # add this to user_config.py
@@ -72,3 +77,11 @@ PIN_SD_MISO = getattr(board,'MISO',None)
 PIN_SD_MOSI = PIN_MOSI
 PIN_SD_CLK  = PIN_CLK
 PIN_SD_CS   = None   # set in board_config.py or user_config.py
+
+# --- touchpad IRQ (optional, MPR121 IRQ-pin)   -------------------------------
+
+PIN_TP_IRQ  = None   # set in board_config.py or user_config.py
+
+# --- INA260 ALERT (optional, used as conversion-ready signal)   --------------
+
+PIN_INA260_ALERT = None   # set in board_config.py or user_config.py
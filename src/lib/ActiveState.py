@@ -20,11 +20,18 @@
 
 import gc
 import time
-import sys
 import asyncio
+from array import array
 from View import ValuesView, PlotView              # for rendering to OLED
 from Data import DataAggregator                    # collects min/mean/max
 from Scales import *                               # unit scaling utilities
+from micropython import const
+
+# minimum slack before the next sample for an explicit gc.collect() (ns)
+_GC_SLACK_NS = const(50000000)
+
+# poll interval while waiting for the data provider to become ready (s)
+_READY_POLL = 0.001
 
 class ActiveState:
     """Manages 'active' state: live measurement collection + display."""
@@ -39,6 +46,17 @@ class ActiveState:
         self._stop = False          # global flag to stop tasks
         self._new_sample = False    # becomes True when a new sample is available
 
+        # optional readiness check of the data provider (e.g. INA260 ALERT-pin)
+        self._data_ready = getattr(app.data_provider, 'data_ready', None)
+
+        # preallocated buffers for oversampling (reused for every sample):
+        # partial sums stay private, since other tasks run while waiting for
+        # the next conversion; the result buffer only ever holds averages
+        self._sum_v = array('f', [0.0] * self._dim)
+        self._avg_v = array('f', [0.0] * self._dim)
+
+        self._dirty = False         # True if the current view needs a redraw
+
         # Set up display views
         if self._app.display:
             # View 0: live voltage/current/power
@@ -54,18 +72,50 @@ class ActiveState:
                     self._views.append(plot)
                     app.results.plots.append(plot)
 
-    def _get_data(self):
-        """Reads data from sensor with optional oversampling."""
-        if self._settings.oversample < 2:
-            return (time.monotonic(), self._app.data_provider.get_data())
-
-        d_sum = [0 for _ in range(self._dim)]
-        for _ in range(self._settings.oversample):
-            data = self._app.data_provider.get_data()
-            for i in range(self._dim):
-                d_sum[i] += data[i]
-        averaged = [d_sum[i] / self._settings.oversample for i in range(self._dim)]
-        return time.monotonic(), averaged
+    async def _wait_ready(self):
+        """Yield to the other tasks until the data provider has a new sample."""
+        ready = self._data_ready
+        if ready:
+            while not (ready() or self._stop):
+                await asyncio.sleep(_READY_POLL)
+
+    async def _get_data(self):
+        """Reads data from sensor with optional oversampling.
+
+        Returns (timestamp in ns, values), or None if the data provider
+        ended the measurement (StopIteration must not leave a coroutine).
+        """
+        get_data = self._app.data_provider.get_data
+        oversample = self._settings.oversample
+        try:
+            if oversample < 2:
+                return (time.monotonic_ns(), get_data())
+
+            # accumulate in place, divide once at the end
+            dim = self._dim
+            acc = self._sum_v
+            data = get_data()
+            for i in range(dim):
+                acc[i] = data[i]
+            for _ in range(oversample - 1):
+                if self._data_ready and not self._data_ready():
+                    gc.enable()     # other tasks may allocate while we wait
+                    await self._wait_ready()
+                data = get_data()
+                for i in range(dim):
+                    acc[i] += data[i]
+        except StopIteration:
+            return None
+        avg = self._avg_v
+        for i in range(dim):
+            avg[i] = acc[i] / oversample
+        return time.monotonic_ns(), avg
+
+    def _set_stop(self):
+        """Stop sampling and wake up all waiting tasks."""
+        self._stop = True
+        self._stop_evt.set()
+        self._render_evt.set()
 
     async def _check_key(self):
         """Monitor touchpad keys during measurement."""
@@ -76,10 +126,15 @@ class ActiveState:
             key = self._app.key_events.is_key_pressed(self._app.key_events.KEYMAP_ACTIVE)
             if key == 'TOGGLE' and self._app.display:
                 self._cur_view = (self._cur_view + 1) % len(self._views)
+                self._render_evt.set()
             elif key == 'STOP':
-                self._stop = True
+                self._set_stop()
                 return
-            await asyncio.sleep(0.1)
+            # next poll in 100ms, or immediately terminate when sampling ends
+            try:
+                await asyncio.wait_for(self._stop_evt.wait(), 0.1)
+            except asyncio.TimeoutError:
+                pass
 
     def _update_views(self):
         """Updates the display contents based on current values."""
@@ -88,15 +143,22 @@ class ActiveState:
             if self._new_sample and self._settings.plots:
                 for i, value in enumerate(self.data_v):
                     self._views[2 + i].set_values([value])
+                if self._cur_view > 1:
+                    self._dirty = True
 
-            # View 0: values, View 1: elapsed time
+            # View 0: values (redraw only if a displayed label changed)
             if self._new_sample and self._cur_view == 0:
-                self._views[self._cur_view].set_values(
-                    self.data_v, time.monotonic() - self._start_t)
+                if self._views[0].set_values(
+                        self.data_v,
+                        (time.monotonic_ns() - self._start_ns) / 1e9):
+                    self._dirty = True
+
+            # View 1: elapsed time
             elif self._cur_view == 1:
-                self._views[self._cur_view].set_values(
-                    [(time.monotonic() - self._start_t) / self._dur_fac,
-                     self._settings.duration], -1)
+                if self._views[1].set_values(
+                        [(time.monotonic_ns() - self._start_ns) / 1e9 / self._dur_fac,
+                         self._settings.duration], -1):
+                    self._dirty = True
 
     async def _show_view(self):
         """Controls screen refresh timing and rendering."""
@@ -105,10 +167,24 @@ class ActiveState:
 
         cur_view = self._cur_view
         update_time = 0.33  # estimated OLED refresh time (sec)
+        update_s = self._settings.update / 1000
+        render_evt = self._render_evt
 
         while not self._stop:
-            await asyncio.sleep(self._settings.update / 1000)
-            gap = self._next_sample_t - time.monotonic()
+            # Wait for a new sample or view change. The elapsed-time view
+            # and auto-rotation (no keypad) also refresh every update-interval
+            if self._cur_view == 1 or not self._app.key_events:
+                try:
+                    await asyncio.wait_for(render_evt.wait(), update_s)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await render_evt.wait()
+            render_evt.clear()
+            if self._stop:
+                break
+
+            gap = (self._next_sample_ns - time.monotonic_ns()) / 1e9
 
             # Skip updating screen if a sample is due soon
             if gap < update_time and update_time < self._int_t:
@@ -117,13 +193,13 @@ class ActiveState:
             s = time.monotonic()
             self._update_views()
 
-            if (self._new_sample or
+            if (self._dirty or
                 not self._app.key_events or
-                self._cur_view == 1 or
                 cur_view != self._cur_view):
                 self._views[self._cur_view].show()
                 cur_view = self._cur_view
                 update_time = time.monotonic() - s
+                self._dirty = False
 
             self._new_sample = False
 
@@ -131,20 +207,25 @@ class ActiveState:
             if not self._app.key_events:
                 self._cur_view = (self._cur_view + 1) % len(self._views)
 
+            # Limit refresh rate to the update-interval
+            rest = update_s - (time.monotonic() - s)
+            if rest > 0:
+                await asyncio.sleep(rest)
+
     def run(self):
         """Synchronous wrapper to initialize and launch async _run()."""
         self._stop = False
-        self._int_fac = int_fac(self._settings.int_scale)
-        self._dur_fac = dur_fac(self._settings.int_scale)
+        self._int_fac, d_scale, self._dur_fac = get_all(self._settings.int_scale)
         self._int_t = self._settings.interval * self._int_fac  # seconds
+        self._int_t_ns = int(self._int_t * 1e9)                # nanoseconds
 
         # Reset views
         if self._app.display:
             self._cur_view = 0
+            self._dirty = False
             self._views[0].clear_values()
             self._views[0].show()
 
-            d_scale = dur_scale(self._settings.int_scale)
             self._views[1].set_units([d_scale, d_scale])
 
             if self._settings.plots:
@@ -156,6 +237,8 @@ class ActiveState:
 
     async def _run(self):
         """Async loop that performs sampling, logging, and screen updates."""
+        self._stop_evt = asyncio.Event()   # wakes the sampler early on STOP
+        self._render_evt = asyncio.Event() # new sample or view change
         key_task = asyncio.create_task(self._check_key())
         view_task = asyncio.create_task(self._show_view())
 
@@ -164,55 +247,90 @@ class ActiveState:
         m_data = DataAggregator(self._dim)
 
         self._app.data_provider.reset()
+        await self._wait_ready()   # first conversion, other tasks keep running
         try:
             self._app.data_provider.get_data()
         except:
             print("\n#data-provider timed out")
             return
 
+        # bind hot-loop lookups to locals once
+        mono_ns = time.monotonic_ns
+        get_data = self._get_data
+        wait_ready = self._wait_ready
+        log_line = self._logger.log_line
+        emit = self._logger.get_emitter()
+        add = m_data.add
+        wait_for = asyncio.wait_for
+        stop_wait = self._stop_evt.wait
+        render_evt = self._render_evt
+        int_t_ns = self._int_t_ns
+
+        # all timing is integer nanoseconds, end_ns == 0: unlimited
+        self._start_ns = mono_ns()
         if self._settings.duration:
-            end_t = time.monotonic() + self._settings.duration * self._dur_fac
+            end_ns = self._start_ns + int(
+                self._settings.duration * self._dur_fac * 1e9)
         else:
-            end_t = sys.maxsize
+            end_ns = 0
 
         data_t_last = 0
-        self._start_t = time.monotonic()
+        self._next_sample_ns = self._start_ns
         samples = 0
+        gc.collect()
+        collected = True
 
         # Main sampling loop
-        while not self._stop and time.monotonic() < end_t:
+        while not self._stop and (not end_ns or mono_ns() < end_ns):
             if data_t_last > 0:
-                sleep_t = max(self._int_t - (time.monotonic() - data_t_last), 0)
-                self._next_sample_t = time.monotonic() + sleep_t
-                while sleep_t:
-                    if sleep_t > 1:
-                        await asyncio.sleep(1)
-                        if self._stop:
-                            break
-                        sleep_t -= 1
-                    else:
-                        await asyncio.sleep(sleep_t)
-                        break
+                # single sleep up to the absolute deadline, cut short on STOP
+                deadline = data_t_last + int_t_ns
+                self._next_sample_ns = deadline
+                # collect garbage now if there is enough time left
+                collected = deadline - mono_ns() > _GC_SLACK_NS
+                if collected:
+                    gc.collect()
+                sleep_ns = deadline - mono_ns()
+                if sleep_ns > 0:
+                    try:
+                        await wait_for(stop_wait(), sleep_ns / 1e9)
+                    except asyncio.TimeoutError:
+                        pass
                 if self._stop:
                     break
 
+            # wait for the next conversion without blocking the other tasks
+            await wait_ready()
+            if self._stop:
+                break
+
+            # After an explicit collect, keep automatic GC out of acquiring
+            # and logging the sample. Automatic GC is never off for longer:
+            # without it, a full heap raises MemoryError instead of collecting
+            if collected:
+                gc.disable()
             try:
-                data_t_last = time.monotonic()
-                self.data_t, self.data_v = self._get_data()
+                data_t_last = mono_ns()
+                sample = await get_data()
+                if sample is None:
+                    self._stop = True
+                    break
+                self.data_t, self.data_v = sample
                 self._new_sample = True
-                self._logger.log_values(self.data_t, self.data_v)
-                m_data.add(self.data_v)
+                render_evt.set()
+                # update statistics, format and log the value line
+                add(self.data_v)
+                log_line(emit(self.data_t / 1e6, self.data_v))
                 samples += 1
-            except StopIteration:
-                self._stop = True
-                break
+            finally:
+                gc.enable()
 
         # Save final results
-        self._app.results.time = self.data_t - self._start_t
+        self._app.results.time = (self.data_t - self._start_ns) / 1e9
         self._app.results.samples = samples
         self._app.results.values = m_data.get()
 
         self._logger.log_summary(samples)
         self._logger.close()
-        self._stop = True
+        self._set_stop()
         await asyncio.gather(key_task, view_task)
\ No newline at end of file
@@ -46,8 +46,8 @@ class ConfigState:
 
         # Create a ConfigView object for each setting
         self._views = [
-            ConfigView(app.display, app.border, headings[i], units[i])
-            for i in range(len(headings))
+            ConfigView(app.display, app.border, heading, unit)
+            for heading, unit in zip(headings, units)
         ]
 
         # Cache views for interval and duration — they need unit adjustments if scale changes
@@ -56,35 +56,36 @@ class ConfigState:
 
     # --- update a setting   ----------------------------------------------------
 
-    def _upd_value(self, nr):
+    def _upd_value(self, view, attr):
         """ Display and allow editing of a setting (via touchpad) """
 
         # Get the current value of this setting from app.settings
-        value = str(getattr(self._app.settings, self._attr[nr]))
+        value = str(getattr(self._app.settings, attr))
+        is_scale = attr == 'int_scale'
 
         while True:
             # Show the current value on the OLED
-            self._views[nr].set_value(value)
-            self._views[nr].show()
+            view.set_value(value)
+            view.show()
 
             # Wait for a touchpad keypress
             key = self._app.key_events.wait_for_key(self._app.key_events.KEYMAP_CONFIG)
 
             # If "Next" key is pressed, save and return
             if key == 'NEXT':
-                if nr == 0:
+                if is_scale:
                     # For int_scale, save as string
-                    setattr(self._app.settings, self._attr[nr], value)
+                    setattr(self._app.settings, attr, value)
                     self._int_view.set_unit(value)                  # Update interval unit display
                     self._dur_view.set_unit(dur_scale(value))       # Update duration unit display
                 else:
                     # For other settings, convert to integer
-                    setattr(self._app.settings, self._attr[nr], int(value))
+                    setattr(self._app.settings, attr, int(value))
                 return
 
             # If "CLR" key is pressed, remove a digit or reset to default
             elif key == 'CLR':
-                if nr == 0:
+                if is_scale:
                     value = 'ms'                                    # default for int_scale
                 elif len(value) > 1:
                     value = value[:-1]                              # remove last digit
@@ -96,9 +97,9 @@ class ConfigState:
                 value = key
 
             # Special case: if editing the interval scale (int_scale), pick from INT_SCALES
-            elif nr == 0:
+            elif is_scale:
                 index = min(int(key), len(INT_SCALES)) - 1
-                value = list(INT_SCALES.items())[index][0]
+                value = INT_SCALES[index]
 
             # Otherwise, append digit to current value (for numbers like 150, 1000, etc.)
             else:
@@ -113,5 +114,5 @@ class ConfigState:
             return
         else:
             # Loop over each setting and allow the user to modify it
-            for i in range(len(self._views)):
-                self._upd_value(i)
+            for view, attr in zip(self._views, self._attr):
+                self._upd_value(view, attr)
@@ -2,6 +2,8 @@
 # Data.py: Helper classes for data-collection and aggregation.
 # ----------------------------------------------------------------------------
 
+from array import array
+
 #DataAggregator	Min, mean, max	Summary stats after measurement
 #DataTable	Rolling buffer	Sparkline plot display during measurement
 
@@ -18,20 +20,21 @@ class DataAggregator:
     def reset(self):
         """Reset internal counters and aggregates."""
         self._n = 0  # Number of samples added
-        # Initialize each stream with [min=large, sum=0, max=0]
-        self._data = [[1e6, -1, 0] for i in range(self._dim)]
+        # One flat array per aggregate (min, sum, max); the running sums
+        # need double precision, or the mean drifts on long runs
+        self._mins = array('f', [1e6] * self._dim)
+        self._sums = array('d', [0.0] * self._dim)
+        self._maxs = array('f', [0.0] * self._dim)
 
     def add(self, values):
         """Add a new data sample to the aggregator."""
         self._n += 1
-        for index, value in enumerate(values):
-            if index == self._dim:
-                break  # ignore extra values
-            self._data[index][1] += value                    # add to sum
-            if value < self._data[index][0]:                 # update min
-                self._data[index][0] = value
-            if value > self._data[index][2]:                 # update max
-                self._data[index][2] = value
+        mins, sums, maxs = self._mins, self._sums, self._maxs
+        for i in range(self._dim):                          # ignore extra values
+            v = values[i]
+            sums[i] += v                                    # add to sum
+            mins[i] = min(mins[i], v)                       # update min
+            maxs[i] = max(maxs[i], v)                       # update max
 
     def get(self, index=None):
         """
@@ -39,17 +42,19 @@ class DataAggregator:
         If index is given, return only that dimension.
         """
         if index is None:
-            return [[data[0], data[1]/self._n, data[2]] for data in self._data]
+            n = self._n
+            return [[mn, s/n, mx]
+                    for mn, s, mx in zip(self._mins, self._sums, self._maxs)]
         else:
             return [
-                self._data[index][0],
-                self._data[index][1]/self._n,
-                self._data[index][2]
+                self._mins[index],
+                self._sums[index]/self._n,
+                self._maxs[index]
             ]
 
     def get_mean(self):
         """Return only the mean value for each stream."""
-        return [data[1]/self._n for data in self._data]
+        return [s/self._n for s in self._sums]
 
 # ----------------------------------------------------------------------------
 # --- DataTable: ring buffer for live plots (sparklines) ---------------------
@@ -64,27 +69,29 @@ class DataTable:
 
     def reset(self):
         """Clear all stored data."""
-        self._n = 0
-        # Create a list of lists: one per dimension (e.g., [[], [], []] for 3 streams)
-        self._data = [[] for i in range(self._dim)]
+        self._n = 0       # number of valid entries (up to size)
+        self._head = 0    # next write position (oldest entry once full)
+        # One preallocated float array per dimension, used as ring buffer
+        self._data = [array('f', [0.0] * self._size) for i in range(self._dim)]
 
     def add(self, values):
         """Add a new set of values to the data table (1 per dimension)."""
-        # If buffer is full, remove oldest value (FIFO behavior)
-        if len(self._data[0]) == self._size:
-            for i in range(self._dim):
-                self._data[i] = self._data[i][1:]
-
-        # Append each value to its respective stream
-        for i in range(self._dim):
-            self._data[i].append(values[i])
+        # Overwrite the oldest slot (FIFO behavior without reallocation)
+        head = self._head
+        for buf, value in zip(self._data, values):
+            buf[head] = value
+        self._head = (head + 1) % self._size
+        if self._n < self._size:
+            self._n += 1
 
     def get(self, index=None):
         """
-        Get all recorded values.
+        Get all recorded values (oldest first).
         If index is given, return only the specified dimension.
         """
         if index is None:
-            return self._data
-        else:
-            return self._data[index]
+            return [self.get(i) for i in range(self._dim)]
+        data = self._data[index]
+        if self._n < self._size:
+            return data[:self._n]
+        return data[self._head:] + data[:self._head]
@@ -5,6 +5,7 @@
 import socketpool         # CircuitPython module for network socket management
 import wifi               # CircuitPython Wi-Fi interface
 from LogWriter import LogWriter  # Base class for all loggers (handles formatting, etc.)
+from micropython import const
 
 # Try importing Wi-Fi credentials from secrets.py
 try:
@@ -13,6 +14,9 @@ except ImportError:
     print("WiFi settings need the file secrets.py, see documentation")
     raise  # Stops execution if no secrets.py exists
 
+# Maximum size of buffered messages sent as one datagram (stays below MTU)
+_MAX_DATAGRAM = const(1100)
+
 # Main class to log data via Wi-Fi
 class DataLogger(LogWriter):
     """ Logs sensor data using Wi-Fi-capable board (ESP32 or Pico W) """
@@ -20,22 +24,25 @@ class DataLogger(LogWriter):
     def __init__(self, app):
         """ Initialize logger and connect to Wi-Fi """
         super(DataLogger, self).__init__(app)  # Call base class constructor
+        self._buf_limit = _MAX_DATAGRAM        # flush buffer per datagram
         self._init_esp32()                     # Setup Wi-Fi and socket
 
     def _init_esp32(self):
         """ Connect to Wi-Fi and prepare a UDP (or TCP) socket """
 
+        ssid = secrets["ssid"]
+        password = secrets["password"]
         retry = secrets["retry"]  # Number of times to retry Wi-Fi connection
 
         # Retry loop for connecting to access point
-        while True:
-            if retry == 0:
-                raise RuntimeError("failed to connect to %s" % secrets["ssid"])
+        for _ in range(retry):
             try:
-                wifi.radio.connect(secrets["ssid"], secrets["password"])  # connect!
+                wifi.radio.connect(ssid, password)  # connect!
                 break  # success
-            except Exception as e:
-                retry -= 1  # try again
+            except Exception:
+                continue  # try again
+        else:
+            raise RuntimeError("failed to connect to %s" % ssid)
 
         # Setup network socket
         pool = socketpool.SocketPool(wifi.radio)  # use the connected Wi-Fi radio
@@ -48,7 +55,7 @@ class DataLogger(LogWriter):
                 type=socketpool.SocketPool.SOCK_DGRAM
             )
             # Destination IP and port from secrets.py
-            self._dest = (secrets["remote_ip"], secrets["remote_port"])
+            self._dest = (secrets["remote_ip"], int(secrets["remote_port"]))
         else:
             # TCP is not implemented in this version (stub only)
             self._socket = pool.socket(
@@ -57,11 +64,11 @@ class DataLogger(LogWriter):
             )
 
     def log(self, msg):
-        """ Sends one message string over the network using the selected protocol """
+        """ Sends buffered messages (bytes) as a single datagram """
         try:
             if self._transport == 'UDP':
-                # Send UTF-8 encoded message to the remote server
-                self._socket.sendto(msg.encode('utf-8'), self._dest)
+                # Send UTF-8 encoded messages to the remote server
+                self._socket.sendto(msg, self._dest)
             else:
                 # TCP not implemented here
                 pass
@@ -4,11 +4,20 @@
 
 import time       # Used for timing and delays
 import math       # Used to generate sine/cosine waveforms for fake data
+from micropython import const
 
 # Choose how many values the fake sensor should return:
 # DIM = 2: simulate [Voltage, Current]
 # DIM = 3: simulate [Voltage1, Voltage2, Current]
-DIM = 3
+DIM = const(3)
+
+# Units and log-format for the selected DIM (fixed at import time)
+if DIM == 2:
+    _UNITS = ('V', 'mA')                     # Voltage, Current
+    _FMT   = "%.2f,%.1f"                     # e.g., 5.00, 100.0
+else:
+    _UNITS = ('V', 'V', 'mA')                # Voltage1, Voltage2, Current
+    _FMT   = "%.2f,%.1f,%.1f"                # e.g., 1.25, 5.10, 100.0
 
 class DataProvider:
     """ Fake sensor data provider for simulation/testing. Mimics INA219 behavior. """
@@ -28,17 +37,11 @@ class DataProvider:
 
     def get_units(self):
         """ Return units for each data channel """
-        if DIM == 2:
-            return ['V', 'mA']          # Voltage, Current
-        else:
-            return ['V', 'V', 'mA']     # Voltage1, Voltage2, Current
+        return _UNITS
 
     def get_fmt(self):
-        """ Return string format for logging each sample """
-        if DIM == 2:
-            return "{1:.2f},{2:.1f}"     # e.g., 5.00, 100.0
-        else:
-            return "{1:.2f},{2:.1f},{3:.1f}"  # e.g., 1.25, 5.10, 100.0
+        """ Return %-format string for logging each sample """
+        return _FMT
 
     def get_data(self):
         """
@@ -3,21 +3,62 @@
 # ----------------------------------------------------------------------------
 
 import time
+import struct
+import digitalio
 from adafruit_ina260 import ConversionTime, AveragingCount, INA260
+from micropython import const
 
-# Optional feature: include power reading in output (3 values vs. 2)
-WITH_POWER = False
+# Optional feature: include power reading in output (1: 3 values, 0: 2)
+WITH_POWER = const(0)
 
 # If no load is detected for this many seconds, stop measuring
-NO_LOAD_TIMEOUT = 60
+NO_LOAD_TIMEOUT = const(60)
+
+# INA260 data registers (16 bit each, MSB first)
+_REG_CURRENT = bytes([0x01])
+_REG_VOLTAGE = bytes([0x02])
+_REG_POWER   = bytes([0x03])
+_REG_MASK    = bytes([0x06])   # Mask/Enable (reading clears conversion-ready)
+
+# Mask/Enable: assert ALERT on conversion-ready (CNVR), active low, no latch
+_MASK_CNVR   = bytes([0x06, 0x04, 0x00])
+
+# Register LSBs from the datasheet
+_I_LSB = 1.25      # mA
+_V_LSB = 0.00125   # V
+_P_LSB = 10        # mW
+
+# Mapping of time index (0-7) to INA260 conversion time enums
+_CONV_TIME = (
+    ConversionTime.TIME_140_us,
+    ConversionTime.TIME_204_us,
+    ConversionTime.TIME_332_us,
+    ConversionTime.TIME_588_us,
+    ConversionTime.TIME_1_1_ms,
+    ConversionTime.TIME_2_116_ms,
+    ConversionTime.TIME_4_156_ms,
+    ConversionTime.TIME_8_244_ms,
+)
+
+# Mapping of averaging count to INA260 averaging count enums
+_COUNT_MAP = {
+    1:    AveragingCount.COUNT_1,
+    4:    AveragingCount.COUNT_4,
+    16:   AveragingCount.COUNT_16,
+    64:   AveragingCount.COUNT_64,
+    128:  AveragingCount.COUNT_128,
+    256:  AveragingCount.COUNT_256,
+    512:  AveragingCount.COUNT_512,
+    1024: AveragingCount.COUNT_1024,
+}
 
 class DataProvider:
     """Provide voltage/current/power data from the INA260 sensor"""
 
     # Define output dimensions and format depending on WITH_POWER flag
     _dim   = 3 if WITH_POWER else 2
-    _units = ['V', 'mA', 'mW']              # measurement units
-    _fmt   = ["{1:.3f}", "{2:.3f}", "{3:.3f}"]  # format strings for CSV logging
+    _units = ('V', 'mA', 'mW')[:_dim]                       # measurement units
+    _fmt   = ','.join(("%.3f", "%.3f", "%.3f")[:_dim])      # CSV logging
 
     def __init__(self, i2c, settings):
         """Initialize the INA260 sensor and apply settings"""
@@ -32,36 +73,39 @@ class DataProvider:
         # Initialize the INA260 chip using Adafruit library
         self._ina260 = INA260(i2c)
 
+        # Raw device access for the hot path (bypasses property accessors)
+        self._dev = self._ina260.i2c_device
+        self._buf = bytearray(6)   # current, voltage, power
+        self._mask_buf = bytearray(2)
+
+        # Optional ALERT-pin: only read registers once a conversion is ready
+        pin = getattr(settings, "pin_ina260_alert", None)
+        if pin:
+            self._alert = digitalio.DigitalInOut(pin)
+            self._alert.switch_to_input(pull=digitalio.Pull.UP)  # open drain
+            with self._dev:
+                self._dev.write(_MASK_CNVR)
+        else:
+            self._alert = None
+
         self.reset()
 
     def _set_config_data(self):
         """Apply user configuration: averaging and conversion time"""
 
         # Validate and sanitize inputs
-        if not hasattr(AveragingCount, f"COUNT_{self._settings.ina260_count}"):
+        count = _COUNT_MAP.get(self._settings.ina260_count)
+        if count is None:
             self._settings.ina260_count = 16
+            count = AveragingCount.COUNT_16
         if self._settings.ina260_ctime < 0 or self._settings.ina260_ctime > 7:
             self._settings.ina260_ctime = 1
 
         # Set averaging count (noise reduction, sampling time)
-        self._ina260.averaging_count = getattr(
-            AveragingCount, f"COUNT_{self._settings.ina260_count}"
-        )
-
-        # Define mapping of time index (0–7) to INA260 conversion time enums
-        CONV_TIME = [
-            ConversionTime.TIME_140_us,
-            ConversionTime.TIME_204_us,
-            ConversionTime.TIME_332_us,
-            ConversionTime.TIME_588_us,
-            ConversionTime.TIME_1_1_ms,
-            ConversionTime.TIME_2_116_ms,
-            ConversionTime.TIME_4_156_ms,
-            ConversionTime.TIME_8_244_ms,
-        ]
+        self._ina260.averaging_count = count
 
         # Set conversion time for both current and voltage channels
-        ctime = CONV_TIME[self._settings.ina260_ctime]
+        ctime = _CONV_TIME[self._settings.ina260_ctime]
         self._ina260.current_conversion_time = ctime
         self._ina260.voltage_conversion_time = ctime
 
@@ -83,11 +127,18 @@ class DataProvider:
 
     def get_units(self):
         """Return measurement units for display/logging"""
-        return DataProvider._units[:DataProvider._dim]
+        return DataProvider._units
 
     def get_fmt(self):
-        """Return format string for CSV-style logging"""
-        return ','.join(DataProvider._fmt[:DataProvider._dim])
+        """Return %-format string for CSV-style logging"""
+        return DataProvider._fmt
+
+    def data_ready(self):
+        """Return True if a new conversion is ready (always True without ALERT-pin)
+
+        Lets the caller wait for the next sample without blocking in get_data().
+        """
+        return not self._alert or not self._alert.value
 
     def get_data(self):
         """Read one sample from INA260 and return it
@@ -97,17 +148,39 @@ class DataProvider:
         """
 
         t_start = time.monotonic()  # start a timer to prevent infinite wait
+        dev = self._dev
+        buf = self._buf
+        alert = self._alert
 
         while True:
-            # Read sensor data
-            v = self._ina260.voltage           # in volts
-            a = max(0, self._ina260.current)   # in mA (ensure non-negative)
-            p = self._ina260.power             # in watts
+            if alert and alert.value:
+                # No new conversion yet: GPIO read only, no I2C traffic
+                if time.monotonic() - t_start > NO_LOAD_TIMEOUT:
+                    raise StopIteration
+                continue
+
+            # Read sensor data: one bus-lock, one pointer-write + 2-byte read
+            # per register (the INA260 does not auto-increment the pointer)
+            with dev:
+                if alert:
+                    # acknowledge conversion-ready, releases ALERT
+                    dev.write_then_readinto(_REG_MASK, self._mask_buf)
+                dev.write_then_readinto(_REG_CURRENT, buf, in_end=2)
+                dev.write_then_readinto(_REG_VOLTAGE, buf, in_start=2, in_end=4)
+                if WITH_POWER:
+                    dev.write_then_readinto(_REG_POWER, buf, in_start=4)
+
+            # current is signed, voltage and power are unsigned
+            i_raw, v_raw, p_raw = struct.unpack_from('>hHH', buf, 0)
+            a = i_raw * _I_LSB if i_raw > 0 else 0   # in mA (ensure non-negative)
+            v = v_raw * _V_LSB                       # in volts
 
             # Check if values exceed thresholds (start logging if so)
             if v >= self._settings.v_min and a >= self._settings.a_min:
                 self._start = True
-                return (v, a, 1000*p) if WITH_POWER else (v, a)
+                if WITH_POWER:
+                    return (v, a, p_raw * _P_LSB)  # in mW
+                return (v, a)
 
             elif self._start:
                 # If logging already started, stop when load disappears
@@ -1,10 +1,45 @@
 # ----------------------------------------------------------------------------
 # LogWriter.py: Base class to format and log VA-meter data
 #
-# Subclasses must implement the method: log(string)
+# Output is collected in a buffer and passed on in larger chunks.
+# Subclasses must implement the method: log(bytes)
+#
+# The data-provider's get_fmt() returns %-style fields for the values
+# only (e.g. "%.3f,%.3f"), the timestamp column is added here. Fields in
+# the older str.format style ("{1:.3f},{2:.3f}") are converted once.
 
+import time
 from Scales import *
 
+_BUF_LIMIT      = 4096   # flush once the buffer reaches this size (bytes)
+_FLUSH_INTERVAL = 1.0    # flush at least every _FLUSH_INTERVAL seconds
+
+# --- create formatter for value lines   -------------------------------------
+
+def _to_percent_fmt(fmt):
+  """ convert str.format fields ({1:.3f}) to %-fields (%.3f), in order """
+
+  if "{" not in fmt:
+    return fmt
+  parts = fmt.split("{")
+  out   = parts[0].replace("%","%%")
+  for part in parts[1:]:
+    field,rest = part.split("}",1)
+    spec = field.split(":",1)[1] if ":" in field else "s"
+    out += "%" + spec + rest.replace("%","%%")
+  return out
+
+def _make_emitter(fmt,dim):
+  """ return a function formatting (t,values) with fmt (bytes) """
+
+  # generated once for the exact column count, with the format as literal:
+  # no loop, *-unpacking or tuple concatenation per sample
+  cols = "".join([",v[%d]" % i for i in range(dim)])
+  src  = "def emit(t,v):\n  return %r %% (t%s)\n" % (fmt,cols)
+  code = {}
+  exec(src,code)
+  return code['emit']
+
 class LogWriter:
   """ log data """
 
@@ -14,7 +49,21 @@ class LogWriter:
     """ constructor """
 
     self.app = app
-    self._fmt = "{0:.1f},"+app.data_provider.get_fmt()+"\n"
+    self._fmt = "%.1f,"+_to_percent_fmt(app.data_provider.get_fmt())+"\n"
+    self._emit = _make_emitter(self._fmt.encode(),
+                               app.data_provider.get_dim())
+    self._buf = bytearray()
+    self._buf_limit = _BUF_LIMIT       # subclasses may lower this
+    self._flush_t = 0
+
+    # settings-header and summary-format, rebuilt only if settings change
+    self._settings_key    = None
+    self._settings_header = b""
+    self._summary_fmt     = b""
+
+    # per-unit format of the summary lines (min,mean,max), pre-encoded
+    self._unit_fmts = [("#%.2f"+u+",%.2f"+u+",%.2f"+u+"\n").encode()
+                       for u in app.data_provider.get_units()]
 
   # --- open logger   --------------------------------------------------------
 
@@ -25,8 +74,17 @@ class LogWriter:
   # --- close logger   -------------------------------------------------------
 
   def close(self):
-    """ close logger (implement in subclass if necessary) """
-    pass
+    """ close logger (subclasses must call this method when overriding) """
+    self.flush()
+
+  # --- write buffered output   ----------------------------------------------
+
+  def flush(self):
+    """ pass buffered output to log() """
+    if self._buf:
+      self.log(bytes(self._buf))
+      self._buf = bytearray()
+    self._flush_t = time.monotonic() + _FLUSH_INTERVAL
 
   # --- print settings   -----------------------------------------------------
 
@@ -34,38 +92,57 @@ class LogWriter:
     """ print settings """
 
     settings = self.app.settings
-    self._int_fac   = int_fac(settings.int_scale)
-    self._dur_scale = dur_scale(settings.int_scale)
-    self._dur_fac   = dur_fac(settings.int_scale)
-
-    self.log("#\n#Interval:   {0:d}{1:s}\n".format(
-      settings.interval,settings.int_scale))
-    if settings.oversample > 0:
-      self.log("#Oversampling: {0:d}X\n".format(settings.oversample))
-    self.log("#Duration:     {0:d}{1:s}\n".format(
-      settings.duration,self._dur_scale))
-    self.log("#Update:       {0:d}ms\n#\n".format(settings.update))
+    key = (settings.interval,settings.int_scale,settings.oversample,
+           settings.duration,settings.update)
+
+    if key != self._settings_key:
+      self._int_fac, self._dur_scale, self._dur_fac = get_all(
+        settings.int_scale)
+
+      header = "#\n#Interval:   {0:d}{1:s}\n".format(
+        settings.interval,settings.int_scale)
+      if settings.oversample > 0:
+        header += "#Oversampling: {0:d}X\n".format(settings.oversample)
+      header += "#Duration:     {0:d}{1:s}\n".format(
+        settings.duration,self._dur_scale)
+      header += "#Update:       {0:d}ms\n#\n".format(settings.update)
+      self._settings_header = header.encode()
+      self._summary_fmt = ("#\n#Duration: %.1f" + self._dur_scale +
+                           "\n#Samples: %d (%.1f/s)" +
+                           "\n#Mean Interval: %.1f" + settings.int_scale +
+                           "\n#Min,Mean,Max\n").encode()
+      self._settings_key    = key
+
+    self._buf.extend(self._settings_header)
+    self.flush()
 
   # --- print values   -------------------------------------------------------
 
   def log_values(self,t,values):
     """ print values """
-    self.log(self._fmt.format(1000*t,*values))
+    self.log_line(self._emit(1000*t,values))
+
+  # --- log preformatted line   ----------------------------------------------
+
+  def get_emitter(self):
+    """ return formatter for value lines: emit(t_ms,values) -> bytes """
+    return self._emit
+
+  def log_line(self,line):
+    """ print a line (bytes) created with get_emitter() """
+    self._buf.extend(line)
+    if (len(self._buf) >= self._buf_limit or
+        time.monotonic() >= self._flush_t):
+      self.flush()
 
   # --- print summary   ------------------------------------------------------
 
   def log_summary(self,samples):
     """ print summary """
 
-    self.log("#\n#Duration: {0:.1f}{1:s}\n".format(
-      self.app.results.time/self._dur_fac,self._dur_scale))
-    self.log("#Samples: {0:d} ({1:.1f}/s)\n".format(
-      samples,samples/self.app.results.time))
-    self.log("#Mean Interval: {0:.1f}{1:s}\n".format(
-      self.app.results.time/self._int_fac/samples,
-      self.app.settings.int_scale))
-    self.log("#Min,Mean,Max\n")
-    units = self.app.data_provider.get_units()
-    for index,value in enumerate(self.app.results.values):
-      self.log("#{1:.2f}{0:s},{2:.2f}{0:s},{3:.2f}{0:s}\n".format(
-        units[index],*value))
+    t = self.app.results.time
+    self._buf.extend(self._summary_fmt % (
+      t/self._dur_fac,samples,samples/t,t/self._int_fac/samples))
+    for fmt,value in zip(self._unit_fmts,self.app.results.values):
+      self._buf.extend(fmt % (value[0],value[1],value[2]))
+    self.flush()
@@ -10,10 +10,13 @@ from View import ResultView  # Imports the view class to show results on the dis
 class ReadyState:
     """Manage the 'ready' state — display results and handle next action."""
 
+    ROTATE_TIME = 2     # Auto-cycle interval without keypad (seconds)
+
     def __init__(self, app):
         """Constructor: Initialize result views."""
         self._app = app         # Reference to main app controller
         self._views = []        # List of views to display results (e.g., voltage, current)
+        self._is_blinka = hasattr(board, '__blinka__')  # PC simulation?
 
         # Get the measurement units from the data provider (e.g., ['V', 'A'])
         units = app.data_provider.get_units()
@@ -32,40 +35,50 @@ class ReadyState:
         - EXIT: exit app (only on PC)
         - Other: toggle view
         """
-        if not self._app.display:
+        app = self._app
+        if not app.display:
             # If no display is attached, skip ready state
             return active
 
+        # Bind frequently used attributes to locals
+        settings = app.settings
+        results = app.results
+        events = app.key_events
+        views = self._views
+        is_blinka = self._is_blinka
+        exit_on = is_blinka and settings.exit
+
         # If plots are enabled and the number of values matches views,
         # extend the view list to include plot views from last session
-        if (self._app.settings.plots and self._app.settings.update and
-            len(self._views) == len(self._app.results.values)):
-            self._views.extend(self._app.results.plots)
+        if (settings.plots and settings.update and
+            len(views) == len(results.values)):
+            views.extend(results.plots)
 
         # Show all results on the result views
         cur_view = 0                      # Start with the first view
-        n_views = len(self._views)       # Total number of views
-        for index, result in enumerate(self._app.results.values):
-            self._views[index].set_values(*result)  # Set the data to each view
-        self._views[cur_view].show()     # Display the first view
+        n_views = len(views)             # Total number of views
+        for index, result in enumerate(results.values):
+            views[index].set_values(*result)  # Set the data to each view
+        views[cur_view].show()           # Display the first view
+        self._next_rotate = time.monotonic() + ReadyState.ROTATE_TIME
 
         # Main key-handling loop
         while True:
-            if not self._app.key_events:
+            if not events:
                 # If there are no buttons (e.g., in Blinka on PC)
 
                 # If running under Blinka and 'exit' flag is set, quit
-                if hasattr(board, '__blinka__') and self._app.settings.exit:
+                if exit_on:
                     return None
                 else:
-                    # Otherwise, auto-cycle views every 2 seconds
+                    # Otherwise, auto-cycle views every 2 seconds (sleeping
+                    # up to a fixed deadline, so the period does not drift)
+                    time.sleep(max(0, self._next_rotate - time.monotonic()))
                     key = 'VIEW'
-                    time.sleep(2)
+                    self._next_rotate += ReadyState.ROTATE_TIME
             else:
                 # Wait for a button press using the KEYMAP_READY mapping
-                key = self._app.key_events.wait_for_key(
-                    self._app.key_events.KEYMAP_READY
-                )
+                key = events.wait_for_key(events.KEYMAP_READY)
 
             # Handle the pressed key
             if key == 'START':
@@ -73,12 +86,11 @@ class ReadyState:
             elif key == 'CONFIG':
                 return config       # Go to ConfigState (change settings)
             elif key == 'EXIT':
-                if hasattr(board, '__blinka__'):
+                if is_blinka:
                     return None     # Exit program (only allowed under Blinka)
                 else:
                     continue        # Ignore EXIT key on physical devices
             else:
                 # Rotate to the next view (wrap around)
                 cur_view = (cur_view + 1) % n_views
-                self._views[cur_view].show()
-                time.sleep(0.1)     # Small delay to debounce button
+                views[cur_view].show()
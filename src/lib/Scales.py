@@ -1,41 +1,65 @@
 
-import collections  # To maintain the order of time units for display and logic
-
 # ----------------------------------------------------------------------------
 # This module defines time scaling utilities for converting between time units
 # and for determining appropriate display/plot labels for durations.
 #
-# - INT_SCALES maps interval scale units to a tuple:
-#     (conversion factor to seconds, next larger duration label)
-#   Example: 'm' → (60.0, 'h')  means 1 minute = 60 seconds, display in hours
+# - INT_SCALES is the tuple of interval scale units in display order
+# - _INT_FAC maps an interval scale unit to its conversion factor to seconds
+# - _DUR_SCALE maps an interval scale unit to the next larger duration label
+#   Example: 'm' → 60.0 and 'h'  means 1 minute = 60 seconds, display in hours
+# - _DUR_FAC is precomputed from both: seconds per unit of the duration label
+# - _SCALE_TABLE combines all three per interval scale unit
 #
 # - int_fac(scale):      Returns how many seconds are in one unit of 'scale'
 # - dur_scale(scale):    Returns the next larger unit label for a given scale
 # - dur_fac(scale):      Returns how many seconds are in one unit of the *duration*
 #                        corresponding to the input interval scale
 #   Example: dur_fac('s') → 60.0 (since durations are shown in 'm' for 's')
+# - get_all(scale):      Returns (int_fac, dur_scale, dur_fac) in one lookup
 # ----------------------------------------------------------------------------
 
-# map interval scale to (conversion factor to seconds, display label for duration)
-INT_SCALES = collections.OrderedDict([
-    ('ms', (0.001, 's')),     # milliseconds → seconds
-    ('s',  (1.0,   'm')),     # seconds → minutes
-    ('m',  (60.0,  'h')),     # minutes → hours
-    ('h',  (3600.0,'d')),     # hours → days
-    ('d',  (86400.0,'d'))     # days → days (label doesn't change)
-])
+# interval scales in display order (plain dicts are not ordered on MicroPython)
+INT_SCALES = ('ms', 's', 'm', 'h', 'd')
+
+# map interval scale to conversion factor to seconds
+_INT_FAC = {
+    'ms': 0.001,      # milliseconds
+    's':  1.0,        # seconds
+    'm':  60.0,       # minutes
+    'h':  3600.0,     # hours
+    'd':  86400.0     # days
+}
+
+# map interval scale to display label for duration
+_DUR_SCALE = {
+    'ms': 's',        # milliseconds → seconds
+    's':  'm',        # seconds → minutes
+    'm':  'h',        # minutes → hours
+    'h':  'd',        # hours → days
+    'd':  'd'         # days → days (label doesn't change)
+}
+
+# map interval scale to conversion factor of the duration label
+_DUR_FAC = {k: _INT_FAC[_DUR_SCALE[k]] for k in _INT_FAC}
+
+# map interval scale to (int_fac, dur_scale, dur_fac)
+_SCALE_TABLE = {k: (_INT_FAC[k], _DUR_SCALE[k], _DUR_FAC[k]) for k in _INT_FAC}
 
 def int_fac(scale):
     """Return the time conversion factor for a given interval scale (e.g., 'm' → 60.0)"""
-    return INT_SCALES[scale][0]
+    return _INT_FAC[scale]
 
 def dur_scale(scale):
     """Return the label of the larger time unit used for duration display (e.g., 'm' → 'h')"""
-    return INT_SCALES[scale][1]
+    return _DUR_SCALE[scale]
 
 def dur_fac(scale):
     """
     Return the duration conversion factor for the next larger time unit.
     For example, if scale is 's', duration is displayed in 'm', so return 60.0
     """
-    return INT_SCALES[dur_scale(scale)][0]
+    return _DUR_FAC[scale]
+
+def get_all(scale):
+    """Return (int_fac, dur_scale, dur_fac) for a given interval scale (e.g., 's' → (1.0, 'm', 60.0))"""
+    return _SCALE_TABLE[scale]
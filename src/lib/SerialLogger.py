@@ -22,6 +22,6 @@ class DataLogger(LogWriter):
   # --- log implementation   -------------------------------------------------
 
   def log(self,msg):
-    """ just pass the string to the builtin print()-function """
+    """ just pass the decoded bytes to the builtin print()-function """
 
-    print(msg,end="")
+    print(msg.decode(),end="")
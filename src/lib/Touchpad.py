@@ -2,35 +2,44 @@
 # Touchpad.py: provide key-events using a MPR121-based 4x3 touchpad
 
 import time
+import digitalio
 import adafruit_mpr121  # Adafruit library to interface with MPR121 capacitive touch controller
 
+_N_PADS = 12  # number of touch pads of the MPR121
+
+def _keymap(keys):
+    """Convert a sparse {pad-index: key} dict to a tuple indexed by pad (None: unused)"""
+    return tuple(keys.get(i) for i in range(_N_PADS))
+
 class KeyEventProvider:
     """Provides key events from a capacitive touchpad (MPR121)."""
 
     DEBOUNCE_TIME = 0.200  # Minimum time between valid touches (200ms)
+    POLL_TIME = 0.010      # Pause between polls while nothing is touched (10ms)
 
     # --- Keymaps: Button index → key label mappings ---
+    # (stored as 12-entry tuples, indexing by pad is cheaper than hashing)
 
     # Portrait orientation: used if settings.tp_orient == 'P'
-    KEYMAP_READY_P = {0: 'START', 4: 'CONFIG', 6: 'TOGGLE', 8: 'EXIT'}
-    KEYMAP_ACTIVE_P = {8: 'STOP', 6: 'TOGGLE'}
-    KEYMAP_CONFIG_P = {
+    KEYMAP_READY_P = _keymap({0: 'START', 4: 'CONFIG', 6: 'TOGGLE', 8: 'EXIT'})
+    KEYMAP_ACTIVE_P = _keymap({8: 'STOP', 6: 'TOGGLE'})
+    KEYMAP_CONFIG_P = _keymap({
         0: 'NEXT', 4: '0', 8: 'CLR',
         1: '7',    5: '8', 9: '9',
         2: '4',    6: '5', 10: '6',
         3: '1',    7: '2', 11: '3'
-    }
-    KEYMAP_SHIFT_P = {0: 'NEXT', 4: 'SHIFT', 8: 'CLR', 5: '0', 9: '.'}
+    })
+    KEYMAP_SHIFT_P = _keymap({0: 'NEXT', 4: 'SHIFT', 8: 'CLR', 5: '0', 9: '.'})
 
     # Landscape orientation: used if settings.tp_orient == 'L'
-    KEYMAP_READY_L = {8: 'START', 4: 'CONFIG', 6: 'TOGGLE', 0: 'EXIT'}
-    KEYMAP_ACTIVE_L = {0: 'STOP', 6: 'TOGGLE'}
-    KEYMAP_CONFIG_L = {
+    KEYMAP_READY_L = _keymap({8: 'START', 4: 'CONFIG', 6: 'TOGGLE', 0: 'EXIT'})
+    KEYMAP_ACTIVE_L = _keymap({0: 'STOP', 6: 'TOGGLE'})
+    KEYMAP_CONFIG_L = _keymap({
         11: '1', 10: '2', 9: '3', 8: 'NEXT',
          7: '4',  6: '5', 5: '6', 4: '0',
          3: '7',  2: '8', 1: '9', 0: 'CLR'
-    }
-    KEYMAP_SHIFT_L = {8: 'NEXT', 4: 'SHIFT', 0: 'CLR', 2: '0', 1: '.'}
+    })
+    KEYMAP_SHIFT_L = _keymap({8: 'NEXT', 4: 'SHIFT', 0: 'CLR', 2: '0', 1: '.'})
 
     def __init__(self, i2c, settings):
         """Initialize the MPR121 device and load correct keymap"""
@@ -38,6 +47,15 @@ class KeyEventProvider:
         self._mpr121 = adafruit_mpr121.MPR121(i2c)  # Connect MPR121 over I2C
         self._last_key = (-1, time.monotonic())  # For debounce checking
 
+        # Optional IRQ-line: MPR121 pulls it low on every touch-status change
+        # and releases it once the status is read
+        pin = getattr(settings, 'pin_tp_irq', None)
+        if pin:
+            self._irq = digitalio.DigitalInOut(pin)
+            self._irq.switch_to_input(pull=digitalio.Pull.UP)
+        else:
+            self._irq = None
+
         # Load keymaps depending on keypad orientation
         if settings.tp_orient == 'L':  # Landscape
             self.KEYMAP_READY = self.KEYMAP_READY_L
@@ -52,11 +70,17 @@ class KeyEventProvider:
 
     def _get_key(self):
         """Internal method: return key index if touched, else None (with debounce)"""
-        touched = self._mpr121.touched_pins  # List of bools for all 12 pads
-        if True not in touched:
+        if self._irq and self._irq.value:
+            return None  # no status change, skip the I2C read
+
+        # touch status of all pads, one I2C read; the register pair also
+        # carries ELEPROX (bit 12) and OVCF (bit 15), keep pads 0-11 only
+        bits = self._mpr121.touched() & 0xFFF
+        if not bits:
             return None
 
-        index = touched.index(True)
+        # lowest touched pad: isolate lowest set bit, take its position
+        index = (bits & -bits).bit_length() - 1
         now = time.monotonic()
 
         # Debounce: ignore repeated presses within 200 ms
@@ -73,11 +97,15 @@ class KeyEventProvider:
 
         while True:
             index = self._get_key()
-            if index not in keymap:
-                continue  # Ignore invalid keys or no touch
+            if index is None:
+                time.sleep(self.POLL_TIME)  # No touch: don't spin on the I2C bus
+                continue
+            key = keymap[index]
+            if key is None:
+                continue  # Ignore invalid keys
 
-            if keymap[index] != 'SHIFT':
-                return keymap[index]  # Return mapped key
+            if key != 'SHIFT':
+                return key  # Return mapped key
             else:
                 # Toggle between normal and shift layout
                 shift = not shift
@@ -86,4 +114,4 @@ class KeyEventProvider:
     def is_key_pressed(self, keymap):
         """Check once whether a key is pressed; return key if valid or None"""
         index = self._get_key()
-        return keymap[index] if index in keymap else None
+        return keymap[index] if index is not None else None
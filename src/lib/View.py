@@ -13,28 +13,55 @@ from adafruit_display_shapes.sparkline import Sparkline
 
 class View:
   FONT_T = terminalio.FONT  # Tiny font
-  FONT_S = bitmap_font.load_font("fonts/DejaVuSansMono-Bold-18-min.pcf")  # Small
-  FONT_L = bitmap_font.load_font("fonts/DejaVuSansMono-Bold-32-min.pcf")  # Large
+  _font_s = None            # Small, loaded on first use (see font_s())
+  _font_l = None            # Large, loaded on first use (see font_l())
   FG_COLOR = 0xFFFFFF  # White foreground
 
+  # value formats and rounding for ranges <10, <100, >=100
+  _FMTS   = ("{0:4.2f}{1:s}", "{0:4.1f}{1:s}", "{0:3.0f}{1:s}")
+  _ROUNDS = (2, 1, 0)
+
+  # All views are hidden subgroups of one root group, which is passed to
+  # the display only once. Showing a view just swaps the hidden flags.
+  _root = None        # root group shared by all views
+  _shown = None       # group of the currently visible view
+
+  @classmethod
+  def font_s(cls):
+    """Return the small font, parse it on first use"""
+    if cls._font_s is None:
+      cls._font_s = bitmap_font.load_font("fonts/DejaVuSansMono-Bold-18-min.pcf")
+    return cls._font_s
+
+  @classmethod
+  def font_l(cls):
+    """Return the large font, parse it on first use"""
+    if cls._font_l is None:
+      cls._font_l = bitmap_font.load_font("fonts/DejaVuSansMono-Bold-32-min.pcf")
+    return cls._font_l
+
   def __init__(self, display, border):
     """Initialize view with display and optional border"""
     self._display = display
     self._border = 1
     if display:
+      if View._root is None:
+        View._root = displayio.Group()
       self._group = displayio.Group()
+      self._group.hidden = True
+      View._root.append(self._group)
       self._offset = border + 2 if border else 0
 
       # If display is larger than 128x64, center it
-      off_w = (display.width - 128) / 2
-      off_h = (display.height - 64) / 2
+      off_w = (display.width - 128) // 2
+      off_h = (display.height - 64) // 2
 
       # Define anchor positions for text
       self._pos_map = {
         'NW': ((0.0, 0.0), (self._offset + off_w, self._offset + off_h)),
         'NE': ((1.0, 0.0), (display.width - self._offset - off_w, self._offset + off_h)),
-        'W':  ((0.0, 0.5), (self._offset + off_w, display.height / 2)),
-        'E':  ((1.0, 0.5), (display.width - self._offset - off_w, display.height / 2)),
+        'W':  ((0.0, 0.5), (self._offset + off_w, display.height // 2)),
+        'E':  ((1.0, 0.5), (display.width - self._offset - off_w, display.height // 2)),
         'SW': ((0.0, 1.0), (self._offset + off_w, display.height - self._offset - off_h)),
         'SE': ((1.0, 1.0), (display.width - self._offset - off_w, display.height - self._offset - off_h)),
       }
@@ -57,21 +84,18 @@ class View:
 
   def format(self, value, unit):
     """Format a float with appropriate precision and unit suffix"""
-    if value < 10:
-      fmt = "{0:4.2f}{1:s}"
-      value = round(value, 2)
-    elif value < 100:
-      fmt = "{0:4.1f}{1:s}"
-      value = round(value, 1)
-    else:
-      fmt = "{0:3.0f}{1:s}"
-      value = round(value, 0)
-    return fmt.format(value, unit)
+    i = (value >= 10) + (value >= 100)
+    return View._FMTS[i].format(round(value, View._ROUNDS[i]), unit)
 
   def show(self):
     """Show this view on the display"""
     if self._display:
-      self._display.show(self._group)
+      if View._shown is None:
+        self._display.show(View._root)
+      elif View._shown is not self._group:
+        View._shown.hidden = True
+      self._group.hidden = False
+      View._shown = self._group
       self._display.refresh()
 
 # ----------------------------------------------------------------------------
@@ -85,30 +109,38 @@ class ValuesView(View):
       self._value = []
       if len(units) < 3:
         pos = ['NE', 'SE']
-        font = View.FONT_L
+        font = View.font_l()
         self._units = units
       else:
         pos = ['NE', 'E', 'SE']
-        font = View.FONT_S
+        font = View.font_s()
         self._units = units[:3]  # only use max 3 units
 
       for i, unit in enumerate(self._units):
         self._value.append(self.add(units[i], pos[i], font))
+      self._text = list(self._units)  # current label texts
 
   def set_values(self, values, elapsed):
-    """Update displayed values"""
+    """Update displayed values, return True if any label text changed"""
+    changed = False
     if self._display:
       for index, value in enumerate(values):
         if index == len(self._value):
           break
-        self._value[index].text = self.format(value, self._units[index])
+        text = self.format(value, self._units[index])
+        if text != self._text[index]:  # skip relayout of unchanged labels
+          self._text[index] = text
+          self._value[index].text = text
+          changed = True
       # Elapsed time could be shown here on large screens (TODO)
+    return changed
 
   def clear_values(self):
     """Clear the value display (reset to units)"""
     if self._display:
       for index in range(len(self._value)):
         self._value[index].text = self._units[index]
+        self._text[index] = self._units[index]
 
   def set_units(self, units):
     """Update the units shown with values"""
@@ -123,20 +155,23 @@ class ResultView(View):
     """Create a result view showing min/mean/max"""
     super().__init__(display, border)
     self._unit = unit
+    self._last = None  # last (min, mean, max) shown
 
     if self._display:
-      self._label_min = self.add('min:', 'NW', View.FONT_S)
-      self._value_min = self.add('0.00', 'NE', View.FONT_S)
+      font = View.font_s()
+      self._label_min = self.add('min:', 'NW', font)
+      self._value_min = self.add('0.00', 'NE', font)
 
-      self._label_mean = self.add('mean:', 'W', View.FONT_S)
-      self._value_mean = self.add('0.00', 'E', View.FONT_S)
+      self._label_mean = self.add('mean:', 'W', font)
+      self._value_mean = self.add('0.00', 'E', font)
 
-      self._label_max = self.add('max:', 'SW', View.FONT_S)
-      self._value_max = self.add('0.00', 'SE', View.FONT_S)
+      self._label_max = self.add('max:', 'SW', font)
+      self._value_max = self.add('0.00', 'SE', font)
 
   def set_values(self, min, mean, max):
     """Update result values"""
-    if self._display:
+    if self._display and (min, mean, max) != self._last:
+      self._last = (min, mean, max)
       self._value_min.text = self.format(min, self._unit)
       self._value_mean.text = self.format(mean, self._unit)
       self._value_max.text = self.format(max, self._unit)
@@ -151,8 +186,8 @@ class ConfigView(View):
     self._unit = unit
 
     if self._display:
-      self._header = self.add(header, 'NW', View.FONT_S)
-      self._value = self.add(' ', 'SE', View.FONT_L)
+      self._header = self.add(header, 'NW', View.font_s())
+      self._value = self.add(' ', 'SE', View.font_l())
 
   def set_value(self, value):
     """Set config value"""
@@ -169,6 +204,8 @@ class ConfigView(View):
 
 
 class PlotView(View):
+  MAX_ITEMS = 64  # points per sparkline
+
   def __init__(self, display, border, units):
     """Create a simple plot view with sparklines"""
     super().__init__(display, border)
@@ -181,7 +218,7 @@ class PlotView(View):
       sparkline = Sparkline(
         width=self._display.width - 2 * self._offset,
         height=self._display.height - 2 * self._offset,
-        max_items=64,
+        max_items=PlotView.MAX_ITEMS,
         dyn_xpitch=False,
         x=0, y=0
       )
@@ -189,22 +226,37 @@ class PlotView(View):
       self._values.append(self.add('0.00', pos[i], View.FONT_T))
       self._group.append(sparkline)
 
+    # values added since the last show(), one list per sparkline
+    self._pending = [[] for _ in self._sparklines]
+    self._text = ['0.00'] * len(self._sparklines)  # current label texts
+
   def reset(self):
     """Clear the plotted data"""
     if self._display:
-      for sparkline in self._sparklines:
+      for sparkline, pending in zip(self._sparklines, self._pending):
         sparkline.clear_values()
+        pending.clear()
 
   def set_values(self, values):
-    """Add new values to the sparkline and update display"""
+    """Queue new values for the sparklines and update the labels"""
     if self._display:
-      for i in range(len(self._sparklines)):
-        self._sparklines[i].add_value(values[i], update=False)
-        self._values[i].text = self.format(values[i], self._units[i])
+      for i, pending in enumerate(self._pending):
+        pending.append(values[i])
+        if len(pending) > PlotView.MAX_ITEMS:
+          del pending[0]   # would scroll out of the sparkline anyway
+        text = self.format(values[i], self._units[i])
+        if text != self._text[i]:  # skip relayout of unchanged labels
+          self._text[i] = text
+          self._values[i].text = text
 
   def show(self):
-    """Render the updated plot on the screen"""
+    """Add queued values and render the updated plot on the screen"""
     if self._display:
-      for sparkline in self._sparklines:
+      for sparkline, pending in zip(self._sparklines, self._pending):
+        if not pending:
+          continue         # nothing new, the last drawing is still valid
+        for value in pending:
+          sparkline.add_value(value, update=False)
+        pending.clear()
         sparkline.update()
       super().show()
@@ -93,6 +93,8 @@ class VAMeter:
     self.settings.pin_sd_mosi = PIN_SD_MOSI
     self.settings.pin_sd_clk  = PIN_SD_CLK
     self.settings.pin_sd_cs   = PIN_SD_CS
+    self.settings.pin_tp_irq  = PIN_TP_IRQ
+    self.settings.pin_ina260_alert = PIN_INA260_ALERT
 
     self.data_provider  = DataProvider(i2c,self.settings)
     self.logger         = DataLogger(self)
@@ -19,6 +19,7 @@ except:
 class Reader(object):
 
   MSG_LENGTH    = 80         # total message-length
+  UDP_LENGTH    = 1500       # max datagram-length (logger batches messages)
   MSG_COLUMNS   =  3         # colums per message 
   V_MIN         = 0.05       # default filter-limit for voltage in V
   PORT          = 6500       # default UDP-port
@@ -257,7 +258,7 @@ class Reader(object):
             continue
         else:
           try:
-            data, _ = sock.recvfrom(Reader.MSG_LENGTH)
+            data, _ = sock.recvfrom(Reader.UDP_LENGTH)
             # take some timings for the report
             self._ttime = time.perf_counter()-start
             self._end_dt = datetime.datetime.now()